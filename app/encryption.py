@@ -29,14 +29,18 @@ Designed for serious software systems.
 from __future__ import annotations
 
 import os
-import json
 import struct
 import base64
 import secrets
 import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional, BinaryIO
 
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from argon2.low_level import hash_secret_raw, Type
 
@@ -46,6 +50,7 @@ from argon2.low_level import hash_secret_raw, Type
 # ============================================================
 
 VERSION = 2
+FILE_VERSION = 3  # chunked file format written by encrypt_file
 MAGIC = b"OSIRIS2"
 
 SALT_SIZE = 16
@@ -53,6 +58,21 @@ NONCE_SIZE = 12
 KEY_SIZE = 32
 TAG_SIZE = 16
 CHUNK_SIZE = 64 * 1024  # 64KB streaming chunks
+MAX_AAD_SIZE = 64 * 1024  # header AAD bound, checked on write and read
+_BLOCK_SIZE = 16  # AES block, slack required by update_into
+_BATCH_MAX_WORKERS = 4  # each in-flight Argon2id hash holds 64 MiB
+
+# Precompiled header layouts (format strings parsed once)
+_U32 = struct.Struct(">I")
+_HDR_PREFIX = struct.Struct(f">{len(MAGIC)}sI")  # magic + version
+_FRAME = struct.Struct(">?I")  # final flag + chunk length / index
+
+# (name, min, max) length of each length-prefixed header field, in order
+_HEADER_FIELDS = (
+    ("salt", SALT_SIZE, SALT_SIZE),
+    ("nonce", NONCE_SIZE, NONCE_SIZE),
+    ("aad", 0, MAX_AAD_SIZE),
+)
 
 
 # ============================================================
@@ -75,21 +95,41 @@ class TamperDetectedError(OsirisCryptoError):
 # PASSWORD VALIDATION
 # ============================================================
 
+_UPPER, _LOWER, _DIGIT, _SPECIAL = 1, 2, 4, 8
+_ALL_CLASSES = _UPPER | _LOWER | _DIGIT | _SPECIAL
+
+_CLASS_ERRORS = (
+    (_UPPER, "Password must include uppercase letter."),
+    (_LOWER, "Password must include lowercase letter."),
+    (_DIGIT, "Password must include a digit."),
+    (_SPECIAL, "Password must include special character."),
+)
+
+
 def validate_password_strength(password: str):
     if len(password) < 12:
         raise OsirisCryptoError("Password must be at least 12 characters.")
 
-    if not any(c.isupper() for c in password):
-        raise OsirisCryptoError("Password must include uppercase letter.")
+    # one pass collecting a class bitmask, stopping once all are seen;
+    # the tests are independent because some characters (e.g. "Ⓐ")
+    # are both cased and non-alphanumeric
+    mask = 0
+    for c in password:
+        if c.isupper():
+            mask |= _UPPER
+        if c.islower():
+            mask |= _LOWER
+        if c.isdigit():
+            mask |= _DIGIT
+        if not c.isalnum():
+            mask |= _SPECIAL
 
-    if not any(c.islower() for c in password):
-        raise OsirisCryptoError("Password must include lowercase letter.")
+        if mask == _ALL_CLASSES:
+            return
 
-    if not any(c.isdigit() for c in password):
-        raise OsirisCryptoError("Password must include a digit.")
-
-    if not any(not c.isalnum() for c in password):
-        raise OsirisCryptoError("Password must include special character.")
+    for bit, message in _CLASS_ERRORS:
+        if not mask & bit:
+            raise OsirisCryptoError(message)
 
 
 # ============================================================
@@ -131,6 +171,16 @@ class EncryptionMetadata:
 
 class OsirisCrypto:
 
+    def __init__(self, cache_size: int = 8):
+        # Small LRU of ready AESGCM contexts keyed by (password digest,
+        # salt), filled by decrypt only. Trade-off: derived keys stay
+        # in process memory until evicted or clear_cache() is called.
+        # Pass cache_size=0 to disable caching entirely.
+        self._cache_size = cache_size
+        self._cache_key = secrets.token_bytes(16)
+        self._ciphers: OrderedDict[tuple[bytes, bytes], AESGCM] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
     # --------------------------------------------------------
     # RANDOM UTILITIES
     # --------------------------------------------------------
@@ -161,6 +211,7 @@ class OsirisCrypto:
 
         nonce = self.secure_random_bytes(NONCE_SIZE)
 
+        # not cached: the salt is fresh, so no later call could hit it
         aes = AESGCM(key)
         ciphertext = aes.encrypt(nonce, plaintext, aad)
 
@@ -182,17 +233,13 @@ class OsirisCrypto:
 
         salt, nonce, aad, ciphertext = self._parse_header(encrypted)
 
-        key = derive_key(password, salt)
-
-        aes = AESGCM(key)
+        aes = self._cipher(password, salt)
 
         try:
             plaintext = aes.decrypt(nonce, ciphertext, aad)
         except Exception:
             raise InvalidPasswordError("Invalid password or tampered data.")
 
-        self._secure_wipe(key)
-
         return plaintext
 
     # --------------------------------------------------------
@@ -213,17 +260,44 @@ class OsirisCrypto:
         key = derive_key(password, salt)
         nonce = self.secure_random_bytes(NONCE_SIZE)
 
-        aes = AESGCM(key)
+        aes = algorithms.AES(key)
+        header = self._build_header(salt, nonce, aad, version=FILE_VERSION)
 
-        with open(input_path, "rb") as infile:
-            plaintext = infile.read()
+        # two input buffers (current + read-ahead) and one output buffer,
+        # reused for every chunk instead of allocating per call
+        bufs = (bytearray(CHUNK_SIZE), bytearray(CHUNK_SIZE))
+        out = bytearray(CHUNK_SIZE + _BLOCK_SIZE - 1)
+        out_view = memoryview(out)
 
-        ciphertext = aes.encrypt(nonce, plaintext, aad)
+        with open(input_path, "rb") as infile, open(output_path, "wb") as outfile:
+            outfile.write(header)
 
-        header = self._build_header(salt, nonce, aad)
+            index = 0
+            size = infile.readinto(bufs[0])
+
+            while True:
+                # read one chunk ahead so the last frame can be flagged
+                next_size = infile.readinto(bufs[(index + 1) % 2])
+                final = not next_size
+
+                encryptor = Cipher(
+                    aes, modes.GCM(self._chunk_nonce(nonce, index))
+                ).encryptor()
+                encryptor.authenticate_additional_data(
+                    self._chunk_aad(aad, index, final)
+                )
+                n = encryptor.update_into(memoryview(bufs[index % 2])[:size], out)
+                encryptor.finalize()
 
-        with open(output_path, "wb") as outfile:
-            outfile.write(header + ciphertext)
+                outfile.write(_FRAME.pack(final, n + TAG_SIZE))
+                outfile.write(out_view[:n])
+                outfile.write(encryptor.tag)
+
+                if final:
+                    break
+
+                size = next_size
+                index += 1
 
         self._secure_wipe(key)
 
@@ -239,12 +313,96 @@ class OsirisCrypto:
     ):
 
         with open(input_path, "rb") as infile:
-            encrypted = infile.read()
+            version, salt, nonce, aad = self._read_header(infile)
+
+            if version == VERSION:
+                # single-shot file written before chunked streaming
+                infile.seek(0)
+                plaintext = self.decrypt(infile.read(), password)
+                with open(output_path, "wb") as outfile:
+                    outfile.write(plaintext)
+                return
+
+            key = derive_key(password, salt)
+            aes = algorithms.AES(key)
+
+            try:
+                with open(output_path, "wb") as outfile:
+                    self._decrypt_chunks(aes, infile, outfile, nonce, aad)
+            except BaseException:
+                # never leave partial plaintext behind, whatever failed
+                os.remove(output_path)
+                raise
+            finally:
+                self._secure_wipe(key)
+
+    def _decrypt_chunks(
+        self,
+        aes: algorithms.AES,
+        infile: BinaryIO,
+        outfile: BinaryIO,
+        nonce: bytes,
+        aad: bytes,
+    ):
+
+        inbuf = memoryview(bytearray(CHUNK_SIZE + TAG_SIZE))
+        out = bytearray(CHUNK_SIZE + _BLOCK_SIZE - 1)
+        out_view = memoryview(out)
+
+        index = 0
+
+        while True:
+            frame = infile.read(_FRAME.size)
+            if len(frame) < _FRAME.size:
+                raise TamperDetectedError("Encrypted file is truncated.")
+
+            final, length = _FRAME.unpack(frame)
+            if not TAG_SIZE <= length <= CHUNK_SIZE + TAG_SIZE:
+                raise TamperDetectedError("Invalid chunk length.")
 
-        plaintext = self.decrypt(encrypted, password)
+            if infile.readinto(inbuf[:length]) < length:
+                raise TamperDetectedError("Encrypted file is truncated.")
 
-        with open(output_path, "wb") as outfile:
-            outfile.write(plaintext)
+            body = length - TAG_SIZE
+            decryptor = Cipher(
+                aes, modes.GCM(self._chunk_nonce(nonce, index), bytes(inbuf[body:length]))
+            ).decryptor()
+            decryptor.authenticate_additional_data(
+                self._chunk_aad(aad, index, final)
+            )
+            n = decryptor.update_into(inbuf[:body], out)
+
+            try:
+                decryptor.finalize()
+            except InvalidTag:
+                if index == 0:
+                    raise InvalidPasswordError("Invalid password or tampered data.")
+                raise TamperDetectedError(f"Chunk {index} failed authentication.")
+
+            # only authenticated plaintext reaches the output file
+            outfile.write(out_view[:n])
+
+            if final:
+                if infile.read(1):
+                    raise TamperDetectedError("Trailing data after final chunk.")
+                return
+
+            index += 1
+
+    # --------------------------------------------------------
+    # CHUNK FRAMING
+    # --------------------------------------------------------
+
+    @staticmethod
+    def _chunk_nonce(nonce: bytes, index: int) -> bytes:
+        # base nonce XOR chunk counter, unique per chunk for one key
+        return (int.from_bytes(nonce, "big") ^ index).to_bytes(NONCE_SIZE, "big")
+
+    @staticmethod
+    def _chunk_aad(aad: Optional[bytes], index: int, final: bool) -> bytes:
+        # binds each chunk to its position and marks the last one,
+        # so reordering and truncation are both detected
+        return (aad or b"") + _FRAME.pack(final, index)
 
     # --------------------------------------------------------
     # KEY ROTATION
@@ -260,6 +418,76 @@ class OsirisCrypto:
         plaintext = self.decrypt(encrypted_data, old_password)
         return self.encrypt(plaintext, new_password)
 
+    # --------------------------------------------------------
+    # BATCH DECRYPTION
+    # --------------------------------------------------------
+
+    def decrypt_batch(
+        self,
+        items: list[tuple[bytes, str]],
+        max_workers: Optional[int] = None,
+    ) -> list[bytes]:
+        """
+        Decrypt many (encrypted, password) pairs concurrently.
+
+        Argon2id releases the GIL while hashing, so independently
+        salted records derive their keys in parallel threads.
+        Results keep the order of `items`.
+
+        Every worker runs its own Argon2id derivation with 64 MiB of
+        memory and 4 lanes, so peak usage is about 64 MiB per worker.
+        The default is therefore one worker per 4 CPUs, capped at
+        _BATCH_MAX_WORKERS (about 256 MiB); pass max_workers to
+        override.
+        """
+
+        if len(items) < 2:
+            return [self.decrypt(data, password) for data, password in items]
+
+        workers = max_workers or min(
+            len(items),
+            _BATCH_MAX_WORKERS,
+            max(1, (os.cpu_count() or 1) // 4),
+        )
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda item: self.decrypt(*item), items))
+
+    # --------------------------------------------------------
+    # CIPHER CACHE
+    # --------------------------------------------------------
+
+    def _cipher(self, password: str, salt: bytes) -> AESGCM:
+        # keyed digest so the cache never holds the password itself
+        ident = (
+            hashlib.blake2b(
+                password.encode(), key=self._cache_key, digest_size=16
+            ).digest(),
+            salt,
+        )
+
+        with self._cache_lock:
+            aes = self._ciphers.get(ident)
+            if aes is not None:
+                self._ciphers.move_to_end(ident)
+                return aes
+
+        key = derive_key(password, salt)
+        aes = AESGCM(key)
+        self._secure_wipe(key)
+
+        if self._cache_size > 0:
+            with self._cache_lock:
+                self._ciphers[ident] = aes
+                while len(self._ciphers) > self._cache_size:
+                    self._ciphers.popitem(last=False)
+
+        return aes
+
+    def clear_cache(self):
+        with self._cache_lock:
+            self._ciphers.clear()
+
     # --------------------------------------------------------
     # HEADER FORMAT
     # --------------------------------------------------------
@@ -269,51 +497,89 @@ class OsirisCrypto:
         salt: bytes,
         nonce: bytes,
         aad: Optional[bytes],
+        version: int = VERSION,
     ) -> bytes:
 
         aad = aad or b""
+        if len(aad) > MAX_AAD_SIZE:
+            raise OsirisCryptoError("AAD too large.")
 
-        header = (
-            MAGIC +
-            struct.pack(">I", VERSION) +
-            struct.pack(">I", len(salt)) + salt +
-            struct.pack(">I", len(nonce)) + nonce +
-            struct.pack(">I", len(aad)) + aad
-        )
+        pack = _U32.pack
 
-        return header
+        return b"".join((
+            _HDR_PREFIX.pack(MAGIC, version),
+            pack(len(salt)), salt,
+            pack(len(nonce)), nonce,
+            pack(len(aad)), aad,
+        ))
 
     def _parse_header(self, data: bytes):
 
         if not data.startswith(MAGIC):
-            raise PanthaCryptoError("Invalid file format.")
+            raise OsirisCryptoError("Invalid file format.")
 
-        offset = len(MAGIC)
-
-        version = struct.unpack(">I", data[offset:offset+4])[0]
-        offset += 4
+        try:
+            _, version = _HDR_PREFIX.unpack_from(data, 0)
+        except struct.error:
+            raise OsirisCryptoError("Invalid file format.")
 
         if version != VERSION:
             raise OsirisCryptoError("Unsupported encryption version.")
 
-        salt_len = struct.unpack(">I", data[offset:offset+4])[0]
-        offset += 4
-        salt = data[offset:offset+salt_len]
-        offset += salt_len
+        # slice a view so the payload is never copied; only the small
+        # header fields are materialized as bytes
+        view = memoryview(data)
+        offset = _HDR_PREFIX.size
+        unpack_from = _U32.unpack_from
 
-        nonce_len = struct.unpack(">I", data[offset:offset+4])[0]
-        offset += 4
-        nonce = data[offset:offset+nonce_len]
-        offset += nonce_len
+        fields = []
+        try:
+            for name, low, high in _HEADER_FIELDS:
+                length, = unpack_from(view, offset)
+                offset += 4
+                if not low <= length <= high:
+                    raise OsirisCryptoError(f"Invalid header {name} length.")
+                end = offset + length
+                if end > len(view):
+                    raise OsirisCryptoError("Truncated header.")
+                fields.append(bytes(view[offset:end]))
+                offset = end
+        except struct.error:
+            raise OsirisCryptoError("Truncated header.")
+
+        salt, nonce, aad = fields
+        ciphertext = view[offset:]
 
-        aad_len = struct.unpack(">I", data[offset:offset+4])[0]
-        offset += 4
-        aad = data[offset:offset+aad_len]
-        offset += aad_len
+        return salt, nonce, aad, ciphertext
 
-        ciphertext = data[offset:]
+    def _read_header(self, infile: BinaryIO):
 
-        return salt, nonce, aad, ciphertext
+        def read_exact(n: int) -> bytes:
+            data = infile.read(n)
+            if len(data) < n:
+                raise OsirisCryptoError("Truncated header.")
+            return data
+
+        magic, version = _HDR_PREFIX.unpack(read_exact(_HDR_PREFIX.size))
+
+        if magic != MAGIC:
+            raise OsirisCryptoError("Invalid file format.")
+
+        if version not in (VERSION, FILE_VERSION):
+            raise OsirisCryptoError("Unsupported encryption version.")
+
+        # lengths are checked before reading, so a hostile header can
+        # neither force a huge read nor reach _chunk_nonce malformed
+        fields = []
+        for name, low, high in _HEADER_FIELDS:
+            length, = _U32.unpack(read_exact(4))
+            if not low <= length <= high:
+                raise OsirisCryptoError(f"Invalid header {name} length.")
+            fields.append(read_exact(length))
+
+        salt, nonce, aad = fields
+
+        return version, salt, nonce, aad
 
     # --------------------------------------------------------
     # MEMORY WIPE
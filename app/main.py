@@ -1,17 +1,33 @@
 from __future__ import annotations
 import os
+import re
 import json
+import threading
 import traceback
+from collections import deque
+from functools import lru_cache, partial
+from itertools import islice
 from pathlib import Path
 from shlex import split as shlex_split
+from time import perf_counter_ns
 
 from textual.app import App, ComposeResult
-from textual.containers import ScrollableContainer
+from textual.binding import Binding
 from textual.widgets import Header, Input, Static, RichLog
 from textual.reactive import reactive
 from rich.markup import escape
+from rich.text import Text
 
-from vault import Vault, VaultError
+from vault import Vault, VaultError, atomic_write
+
+# ---------------------------------------------------------
+# OPTIONAL FAST JSON
+# ---------------------------------------------------------
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # =========================================================
@@ -26,16 +42,129 @@ def user_data_dir() -> Path:
 DATA_DIR = user_data_dir()
 HISTORY_FILE = DATA_DIR / "history.json"
 PIN_FILE = DATA_DIR / "pins.json"
+LATENCY_FILE = DATA_DIR / "latency.txt"
+
+# read once at import; Windows sets USERNAME/COMPUTERNAME,
+# POSIX shells set USER/HOSTNAME
+_env = os.environ
+USERNAME = _env.get("USERNAME") or _env.get("USER") or "osiris"
+HOSTNAME = _env.get("COMPUTERNAME") or _env.get("HOSTNAME") or "local"
+
+DEBUG = bool(_env.get("OSIRIS_DEBUG"))  # show full tracebacks
+PROFILE = bool(_env.get("OSIRIS_PROFILE"))  # record command latency
+
+FLUSH_INTERVAL = 2.0  # seconds between coalesced history/pin writes
+MAX_FLUSH_BACKOFF = 32  # ticks skipped between retries while saves fail
+HISTORY_LIMIT = 200  # commands kept in history.json
+MAX_LOG_LINES = 2000  # RichLog scrollback cap
+
+
+# =========================================================
+# PERSISTENCE
+# =========================================================
+
+def dump_json(data) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def load_json(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def read_file(path: Path) -> bytes | None:
+    # one open + fstat + read on a raw fd; None when missing
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    except FileNotFoundError:
+        return None
+
+    try:
+        remaining = os.fstat(fd).st_size
+        chunks = []
+        while remaining > 0:
+            chunk = os.read(fd, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+# =========================================================
+# PROFILING
+# =========================================================
+
+class LatencyHistogram:
+    """Power-of-two microsecond buckets, so percentiles stay cheap
+    to record and report without keeping every sample."""
+
+    PERCENTILES = (50, 90, 99, 100)
+
+    def __init__(self):
+        self.buckets: dict[int, int] = {}
+        self.count = 0
+
+    def record(self, ns: int):
+        # bucket b holds samples below 2**b microseconds
+        b = (ns // 1000).bit_length()
+        self.buckets[b] = self.buckets.get(b, 0) + 1
+        self.count += 1
+
+    def percentile(self, p: int) -> int:
+        target = self.count * p / 100
+        seen = 0
+        for b in sorted(self.buckets):
+            seen += self.buckets[b]
+            if seen >= target:
+                return 1 << b
+        return 0
+
+    def report(self) -> str:
+        lines = [f"commands: {self.count}"]
+        lines += [
+            f"p{p}: <{self.percentile(p)} us" for p in self.PERCENTILES
+        ]
+        return "\n".join(lines) + "\n"
+
+
+# =========================================================
+# COMMAND PARSING
+# =========================================================
+
+def split_command(cmd: str) -> list[str]:
+    # most commands carry no quoting, so str.split suffices;
+    # shlex is only needed when quotes or escapes appear
+    if '"' in cmd or "'" in cmd or "\\" in cmd:
+        return shlex_split(cmd)
+    return cmd.split()
+
+
+# =========================================================
+# DISPLAY
+# =========================================================
+
+# Titles are re-listed far more often than they change, so their
+# escaped form is memoized rather than recomputed per listing.
+escape_title = lru_cache(maxsize=1024)(escape)
+
+
+@lru_cache(maxsize=32)
+def search_pattern(query: str) -> re.Pattern:
+    # literal, case-insensitive; compiled once per distinct query
+    return re.compile(re.escape(query), re.IGNORECASE)
 
 
 # =========================================================
 # ASCII BANNER
 # =========================================================
 
-class PanthaBanner(Static):
-    def on_mount(self) -> None:
-        self.update(
-r"""
+BANNER = r"""
  ██████  ███████ ██ ██████  ██ ███████  ██████ ██      ██
 ██    ██ ██      ██ ██   ██ ██ ██      ██      ██      ██
 ██    ██ ███████ ██ ██████  ██ ███████ ██      ██      ██
@@ -43,7 +172,52 @@ r"""
  ██████  ███████ ██ ██   ██ ██ ███████  ██████ ███████ ██  --  ENCRYPTED & SECURE NOTE-BASED TERMINAL
                                                                         Brought to you by: V1LE-CODE™
 """
-        )
+
+
+class PanthaBanner(Static):
+    def __init__(self, **kwargs):
+        # plain text: no markup to parse, set once at construction
+        super().__init__(BANNER, markup=False, **kwargs)
+
+
+# =========================================================
+# HELP / MESSAGES
+# =========================================================
+
+# parsed once; RichLog renders the Text without re-reading markup
+HELP_TEXT = Text.from_markup("""
+[bold #a366ff]COMMAND LIST[/]
+
+[#aa00ff]unlock[/] [#888888]<pass>[/]
+[#aa00ff]lock[/]
+[#aa00ff]status[/]
+
+[#aa00ff]note[/] list
+[#aa00ff]note[/] create [#888888]<title>[/]
+[#aa00ff]note[/] view [#888888]<title>[/]
+[#aa00ff]note[/] delete [#888888]<title>[/]
+[#aa00ff]note[/] append [#888888]<title> <text>[/]
+[#aa00ff]note[/] rename [#888888]<old> <new>[/]
+[#aa00ff]note[/] pin [#888888]<title>[/]
+[#aa00ff]note[/] unpin [#888888]<title>[/]
+[#aa00ff]note[/] pinned
+[#aa00ff]note[/] search [#888888]<text>[/]
+
+[#888888]history
+clear
+exit[/]
+""")
+
+
+# fixed one-line messages, styled once instead of markup-parsed per write
+GREETING_TEXT = Text.from_markup(
+    "[bold #a366ff]OSI Encryption Online[/]\n"
+    "Type [bold]help[/] For Command List"
+)
+UNLOCKED_TEXT = Text("Vault unlocked", style="green")
+UNLOCK_FAILED_TEXT = Text("Unlock failed", style="red")
+STATUS_UNLOCKED_TEXT = Text("Unlocked", style="green")
+STATUS_LOCKED_TEXT = Text("Locked", style="yellow")
 
 
 # =========================================================
@@ -51,7 +225,13 @@ r"""
 # =========================================================
 
 class StatusBar(Static):
+    _last: str | None = None
+
     def set(self, text: str):
+        # skip the re-render when the status has not changed
+        if text == self._last:
+            return
+        self._last = text
         self.update(f" STATUS ▸ {text} ")
 
 
@@ -101,6 +281,9 @@ class OsirisCLI(App):
         ("ctrl+n", "list_notes", "Notes"),
         ("up", "history_prev", ""),
         ("down", "history_next", ""),
+        # swallow ctrl+p through the binding table instead of an
+        # on_key handler that runs for every keystroke
+        Binding("ctrl+p", "command_palette", show=False, priority=True),
     ]
 
     status_text: reactive[str] = reactive("Ready")
@@ -111,23 +294,76 @@ class OsirisCLI(App):
         super().__init__()
         self.vault: Vault | None = None
         self.osiris_mode = False
-        self.command_history: list[str] = []
-        self.history_index = -1
 
-        self.username = os.environ.get("USERNAME") or os.environ.get("USER") or "osiris"
-        self.hostname = os.environ.get("COMPUTERNAME") or "local"
+        # a running unlock thread cannot be cancelled, so each attempt
+        # gets a generation number and unlock_done drops stale results
+        self._unlock_gen = 0
+        self._unlock_pending = False
+        self.command_history: deque[str] = deque(maxlen=HISTORY_LIMIT)
+        self.history_index = 0
+
+        self.username = USERNAME
+        self.hostname = HOSTNAME
+        # styled once; commands are appended as plain text, so they
+        # need no escaping and no markup parse per line
+        self._prompt = Text.assemble(
+            (f"{self.username}@{self.hostname}", "#7c33ff"), " $ "
+        )
+
+        # command name -> handler, keys already lower-case
+        self.commands = {
+            "help": self.cmd_help,
+            "unlock": self.cmd_unlock,
+            "lock": self.cmd_lock,
+            "status": self.cmd_status,
+            "note": self.cmd_note,
+            "history": self.cmd_history,
+            "clear": self.cmd_clear,
+            "exit": self.cmd_exit,
+            "quit": self.cmd_exit,
+        }
+
+        # note subcommand -> (handler, required args, usage)
+        self.note_commands = {
+            "list": (self.note_list, 0, "note list"),
+            "create": (self.note_create, 1, "note create <title>"),
+            "view": (self.note_view, 1, "note view <title>"),
+            "delete": (self.note_delete, 1, "note delete <title>"),
+            "append": (self.note_append, 1, "note append <title> <text>"),
+            "rename": (self.note_rename, 2, "note rename <old> <new>"),
+            "pin": (self.note_pin, 1, "note pin <title>"),
+            "unpin": (self.note_unpin, 1, "note unpin <title>"),
+            "pinned": (self.note_pinned, 0, "note pinned"),
+            "search": (self.note_search, 1, "note search <text>"),
+        }
+
+        # pending writes, coalesced by flush_pending()
+        self._history_dirty = False
+        self._pins_dirty = False
+
+        # serialized snapshots waiting for the writer thread; the
+        # writer always drains the newest data, so a late worker can
+        # never put an older snapshot back on disk
+        self._pending_writes: dict[Path, bytes] = {}
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+        # while saves keep failing: reported once, retried with backoff
+        self._save_failing = False
+        self._flush_backoff = 0
+        self._flush_skip = 0
+
+        # submit-to-return latency of each command, OSIRIS_PROFILE only
+        self._latency = LatencyHistogram() if PROFILE else None
 
         self.load_history()
         self.load_pins()
+        self.history_index = len(self.command_history)
 
     # =====================================================
     # BLOCK PALETTE
     # =====================================================
 
-    def on_key(self, event):
-        if event.key == "ctrl+p":
-            event.stop()
-
     def action_command_palette(self):
         pass
 
@@ -139,28 +375,38 @@ class OsirisCLI(App):
         yield Header(show_clock=True)
         yield PanthaBanner()
 
-        with ScrollableContainer():
-            yield RichLog(id="log", markup=True, wrap=True)
+        # keep direct references; every command writes to these
+        self._log = RichLog(
+            id="log", markup=True, wrap=True, max_lines=MAX_LOG_LINES
+        )
+        self._input = Input(id="command_input", placeholder="Enter command...")
+        self._status = StatusBar(id="statusbar")
 
-        yield Input(id="command_input", placeholder="Enter command...")
-        yield StatusBar(id="statusbar")
+        yield self._log
+        yield self._input
+        yield self._status
 
     def on_mount(self):
-        log = self.query_one("#log", RichLog)
-        log.write("[bold #a366ff]OSI Encryption Online[/]")
-        log.write("Type [bold]help[/] For Command List")
+        self._log.write(GREETING_TEXT)
         self.focus_input()
         self.update_status("Encryption Online")
+        self.set_interval(FLUSH_INTERVAL, self.flush_pending)
+
+    def on_unmount(self):
+        # last chance to save: write synchronously before exit
+        self.flush_pending(background=False)
+        if self._latency is not None and self._latency.count:
+            LATENCY_FILE.write_text(self._latency.report())
 
     def focus_input(self):
-        self.query_one("#command_input", Input).focus()
+        self._input.focus()
 
     # =====================================================
     # HOTKEYS
     # =====================================================
 
     def action_clear_log(self):
-        self.query_one("#log", RichLog).clear()
+        self._log.clear()
 
     def action_quit_app(self):
         self.exit()
@@ -174,17 +420,24 @@ class OsirisCLI(App):
             return
         self.run_command_safe("note list")
 
+    # history_index == len(command_history) means "past the newest
+    # entry", i.e. a fresh empty prompt
+
     def action_history_prev(self):
-        if not self.command_history:
+        if self.history_index <= 0:
             return
-        self.history_index = max(0, self.history_index - 1)
-        self.query_one("#command_input", Input).value = self.command_history[self.history_index]
+        self.history_index -= 1
+        self._input.value = self.command_history[self.history_index]
 
     def action_history_next(self):
-        if not self.command_history:
+        end = len(self.command_history)
+        if self.history_index >= end:
             return
-        self.history_index = min(len(self.command_history)-1, self.history_index + 1)
-        self.query_one("#command_input", Input).value = self.command_history[self.history_index]
+        self.history_index += 1
+        self._input.value = (
+            self.command_history[self.history_index]
+            if self.history_index < end else ""
+        )
 
     # =====================================================
     # INPUT
@@ -193,8 +446,14 @@ class OsirisCLI(App):
     def on_input_submitted(self, event: Input.Submitted):
         cmd = event.value.strip()
         event.input.value = ""
-        self.history_index = len(self.command_history)
-        self.run_command_safe(cmd)
+        if not cmd:
+            return
+        if self._latency is None:
+            self.run_command_safe(cmd)
+        else:
+            start = perf_counter_ns()
+            self.run_command_safe(cmd)
+            self._latency.record(perf_counter_ns() - start)
         self.focus_input()
 
     # =====================================================
@@ -202,47 +461,126 @@ class OsirisCLI(App):
     # =====================================================
 
     def load_history(self):
-        if HISTORY_FILE.exists():
-            self.command_history = json.loads(HISTORY_FILE.read_text())
+        raw = read_file(HISTORY_FILE)
+        if raw:
+            self.command_history = deque(load_json(raw), maxlen=HISTORY_LIMIT)
 
     def save_history(self):
-        HISTORY_FILE.write_text(json.dumps(self.command_history, indent=2))
+        self.queue_write(HISTORY_FILE, dump_json(list(self.command_history)))
 
     # =====================================================
     # PINS
     # =====================================================
 
     def load_pins(self):
-        if PIN_FILE.exists():
-            self.pins = set(json.loads(PIN_FILE.read_text()))
-        else:
-            self.pins = set()
+        raw = read_file(PIN_FILE)
+        self.pins = set(load_json(raw)) if raw else set()
 
     def save_pins(self):
-        PIN_FILE.write_text(json.dumps(list(self.pins), indent=2))
+        self.queue_write(PIN_FILE, dump_json(list(self.pins)))
+
+    # =====================================================
+    # DEFERRED SAVE
+    # =====================================================
+
+    def flush_pending(self, background: bool = True):
+        # snapshots are taken here on the UI thread; only the fsync'd
+        # disk writes move to a worker thread
+        if self._history_dirty:
+            self._history_dirty = False
+            self.save_history()
+
+        if self._pins_dirty:
+            self._pins_dirty = False
+            self.save_pins()
+
+        if not self._pending_writes:
+            return
+
+        if background and self._flush_skip:
+            self._flush_skip -= 1
+            return
+
+        if background:
+            # a failed write must never take the app down with it
+            self.run_worker(
+                self.write_pending_worker,
+                thread=True,
+                group="flush",
+                exit_on_error=False,
+            )
+        else:
+            self.save_finished(self.write_pending())
+
+    def queue_write(self, path: Path, data: bytes):
+        with self._pending_lock:
+            self._pending_writes[path] = data
+
+    def write_pending(self) -> OSError | None:
+        # a failed snapshot goes back in the queue (unless a newer one
+        # arrived meanwhile) so the next flush retries it; the error is
+        # returned for the caller to report instead of raised
+        error = None
+        with self._write_lock:
+            with self._pending_lock:
+                pending, self._pending_writes = self._pending_writes, {}
+            for path, data in pending.items():
+                try:
+                    atomic_write(path, data)
+                except OSError as e:
+                    error = e
+                    with self._pending_lock:
+                        self._pending_writes.setdefault(path, data)
+        return error
+
+    def write_pending_worker(self):
+        self.call_from_thread(self.save_finished, self.write_pending())
+
+    def save_finished(self, error: OSError | None):
+        if error is None:
+            if self._save_failing:
+                self._save_failing = False
+                self.log_write(Text("Saves resumed", style="green"))
+            self._flush_backoff = self._flush_skip = 0
+            return
+
+        # report the first failure only, then retry every 1, 2, 4, ...
+        # ticks instead of logging and hitting the disk every tick
+        if not self._save_failing:
+            self._save_failing = True
+            self.log_write(Text(f"Save failed: {error}", style="red"))
+        self._flush_backoff = min(self._flush_backoff * 2 or 1, MAX_FLUSH_BACKOFF)
+        self._flush_skip = self._flush_backoff
 
     # =====================================================
     # LOG
     # =====================================================
 
-    def log_write(self, text: str):
-        self.query_one("#log", RichLog).write(text)
+    def log_write(self, text: str | Text):
+        self._log.write(text)
 
     # =====================================================
     # SAFE EXEC
     # =====================================================
 
     def run_command_safe(self, cmd: str):
-        log = self.query_one("#log", RichLog)
-        log.write(f"[#7c33ff]{self.username}@{self.hostname}[/] $ {escape(cmd)}")
+        log = self._log
+        log.write(Text.assemble(self._prompt, cmd))
 
         try:
             self.command_history.append(cmd)
-            self.save_history()
+            self._history_dirty = True
+            # every entry point (Input, hotkeys) resets the cursor
+            self.history_index = len(self.command_history)
             self.run_command(cmd)
-        except Exception:
-            log.write("[bold red]INTERNAL ERROR[/]")
-            log.write(escape(traceback.format_exc()))
+        except Exception as e:
+            # full tracebacks only when debugging; the summary is enough
+            # for users and skips formatting the whole frame chain
+            if DEBUG:
+                detail = traceback.format_exc()
+            else:
+                detail = f"{type(e).__name__}: {e}"
+            log.write("[bold red]INTERNAL ERROR[/]\n" + escape(detail))
 
     # =====================================================
     # COMMAND ROUTER
@@ -250,85 +588,102 @@ class OsirisCLI(App):
 
     def run_command(self, cmd: str):
 
-        log = self.query_one("#log", RichLog)
-        parts = shlex_split(cmd)
+        parts = split_command(cmd)
         if not parts:
             return
 
-        c = parts[0].lower()
+        handler = self.commands.get(parts[0].lower())
+        if handler is None:
+            self.log_write("Unknown command")
+            return
 
-        if c == "help":
-            log.write("""
-[bold #a366ff]COMMAND LIST[/]
+        handler(parts)
 
-[#aa00ff]unlock[/] [#888888]<pass>[/]
-[#aa00ff]lock[/]
-[#aa00ff]status[/]
+    # =====================================================
+    # COMMANDS
+    # =====================================================
 
-[#aa00ff]note[/] list
-[#aa00ff]note[/] create [#888888]<title>[/]
-[#aa00ff]note[/] view [#888888]<title>[/]
-[#aa00ff]note[/] delete [#888888]<title>[/]
-[#aa00ff]note[/] append [#888888]<title> <text>[/]
-[#aa00ff]note[/] rename [#888888]<old> <new>[/]
-[#aa00ff]note[/] pin [#888888]<title>[/]
-[#aa00ff]note[/] unpin [#888888]<title>[/]
-[#aa00ff]note[/] pinned
+    def cmd_help(self, parts):
+        self.log_write(HELP_TEXT)
 
-[#888888]history
-clear
-exit[/]
-""")
+    def cmd_unlock(self, parts):
+        if len(parts) < 2:
+            self.log_write("Usage: unlock <password>")
             return
-
-        if c == "unlock":
-            if len(parts) < 2:
-                log.write("Usage: unlock <password>")
-                return
-            self.vault = Vault(str(DATA_DIR))
-            try:
-                self.vault.unlock(parts[1])
-                self.osiris_mode = True
-                log.write("[green]Vault unlocked[/]")
-                self.update_status("Vault Unlocked")
-            except Exception:
-                log.write("[red]Unlock failed[/]")
-                self.update_status("Unlock Failed")
+        if self.osiris_mode:
+            self.log_write("Vault already unlocked")
             return
-
-        if c == "lock":
-            if self.vault:
-                self.vault.lock()
-                self.osiris_mode = False
-                log.write("Vault locked")
-                self.update_status("Locked")
+        if self._unlock_pending:
+            self.log_write("Unlock already in progress")
             return
+        self._unlock_pending = True
+        self._unlock_gen += 1
+        self.update_status("Unlocking...")
+        # key derivation takes a few hundred ms; keep it off the UI loop
+        self.run_worker(
+            partial(self.unlock_vault, parts[1], self._unlock_gen),
+            thread=True,
+            group="unlock",
+        )
 
-        if c == "status":
-            log.write("[green]Unlocked[/]" if self.osiris_mode else "[yellow]Locked[/]")
+    def unlock_vault(self, password: str, gen: int):
+        vault = Vault(str(DATA_DIR))
+        try:
+            vault.unlock(password)
+        except Exception:
+            vault = None
+        self.call_from_thread(self.unlock_done, vault, gen)
+
+    def unlock_done(self, vault: Vault | None, gen: int):
+        if gen != self._unlock_gen:
+            # superseded, e.g. by a lock issued while it was running
+            if vault is not None:
+                vault.lock()
             return
-
-        if c == "note":
-            if not self.osiris_mode:
-                log.write("Unlock vault first")
-                return
-            self.handle_note(parts)
+        self._unlock_pending = False
+        if vault is None:
+            self.log_write(UNLOCK_FAILED_TEXT)
+            self.update_status("Unlock Failed")
             return
-
-        if c == "history":
-            for i, cmd in enumerate(self.command_history[-20:], 1):
-                log.write(f"{i}. {cmd}")
+        self.vault = vault
+        self.osiris_mode = True
+        self.log_write(UNLOCKED_TEXT)
+        self.update_status("Vault Unlocked")
+
+    def cmd_lock(self, parts):
+        if self._unlock_pending:
+            # invalidate the in-flight attempt so it cannot unlock later
+            self._unlock_gen += 1
+            self._unlock_pending = False
+            self.log_write("Unlock cancelled")
+            self.update_status("Locked")
+        if self.vault:
+            self.vault.lock()
+            self.osiris_mode = False
+            self.log_write("Vault locked")
+            self.update_status("Locked")
+
+    def cmd_status(self, parts):
+        self.log_write(STATUS_UNLOCKED_TEXT if self.osiris_mode else STATUS_LOCKED_TEXT)
+
+    def cmd_note(self, parts):
+        if not self.osiris_mode:
+            self.log_write("Unlock vault first")
             return
+        self.handle_note(parts)
 
-        if c == "clear":
-            log.clear()
-            return
+    def cmd_history(self, parts):
+        history = self.command_history
+        recent = islice(history, max(0, len(history) - 20), None)
+        lines = [f"{i}. {escape(cmd)}" for i, cmd in enumerate(recent, 1)]
+        if lines:
+            self.log_write("\n".join(lines))
 
-        if c in ("exit", "quit"):
-            self.exit()
-            return
+    def cmd_clear(self, parts):
+        self._log.clear()
 
-        log.write("Unknown command")
+    def cmd_exit(self, parts):
+        self.exit()
 
     # =====================================================
     # NOTE COMMANDS
@@ -336,80 +691,113 @@ exit[/]
 
     def handle_note(self, parts):
 
-        log = self.query_one("#log", RichLog)
         if len(parts) < 2:
             return
 
-        action = parts[1]
-        vault = self.vault
+        entry = self.note_commands.get(parts[1])
+        if entry is None:
+            self.log_write("Unknown note command")
+            return
+
+        # arguments are validated once here, so handlers can index freely
+        handler, required, usage = entry
+        args = parts[2:]
+        if len(args) < required:
+            self.log_write(f"Usage: {usage}")
+            return
 
         try:
+            handler(args)
+        except VaultError as e:
+            self.log_write(str(e))
+
+    def note_list(self, args):
+        pins = self.pins
+        lines = [
+            f"📌 {escape_title(title)}" if title in pins else escape_title(title)
+            for title in self.vault.list_titles()
+        ]
+        if lines:
+            self.log_write("\n".join(lines))
+
+    def note_create(self, args):
+        self.vault.create_note(args[0], "")
+        self.log_write("Created")
+
+    def note_view(self, args):
+        self.log_write(escape(self.vault.read_note_by_title(args[0])))
+
+    def note_delete(self, args):
+        title = args[0]
+        self.vault.delete_note_by_title(title)
+        if title in self.pins:
+            self.pins.discard(title)
+            self._pins_dirty = True
+        self.log_write("Deleted")
+
+    def note_append(self, args):
+        text = " ".join(args[1:])
+        if not text.strip():
+            self.log_write("Nothing to append")
+            return
+        vault = self.vault
+        note_id = vault.find_note_id(args[0])
+        old = vault.read_note(note_id)
+        vault.update_note(note_id, old + "\n" + text)
+        self.log_write("Updated")
 
-            if action == "list":
-                for meta in vault.list_notes().values():
-                    pin = "📌 " if meta["title"] in self.pins else ""
-                    log.write(f"{pin}{meta['title']}")
-                return
-
-            if action == "create":
-                vault.create_note(parts[2], "")
-                log.write("Created")
-                return
-
-            if action == "view":
-                log.write(vault.read_note_by_title(parts[2]))
-                return
-
-            if action == "delete":
-                title = parts[2]
-                vault.delete_note_by_title(title)
-                self.pins.discard(title)
-                self.save_pins()
-                log.write("Deleted")
-                return
-
-            if action == "append":
-                title = parts[2]
-                text = " ".join(parts[3:])
-                old = vault.read_note_by_title(title)
-                vault.update_note_by_title(title, old + "\n" + text)
-                log.write("Updated")
-                return
-
-            if action == "rename":
-                old, new = parts[2], parts[3]
-                txt = vault.read_note_by_title(old)
-                vault.delete_note_by_title(old)
-                vault.create_note(new, txt)
-                log.write("Renamed")
-                return
-
-            if action == "pin":
-                self.pins.add(parts[2])
-                self.save_pins()
-                log.write("Pinned")
-                return
-
-            if action == "unpin":
-                self.pins.discard(parts[2])
-                self.save_pins()
-                log.write("Unpinned")
-                return
-
-            if action == "pinned":
-                for p in self.pins:
-                    log.write(f"📌 {p}")
-                return
+    def note_rename(self, args):
+        vault = self.vault
+        vault.rename_note(vault.find_note_id(args[0]), args[1])
+        self.log_write("Renamed")
+
+    def note_pin(self, args):
+        # only schedule a write when the set actually changes
+        if args[0] not in self.pins:
+            self.pins.add(args[0])
+            self._pins_dirty = True
+        self.log_write("Pinned")
+
+    def note_unpin(self, args):
+        if args[0] in self.pins:
+            self.pins.discard(args[0])
+            self._pins_dirty = True
+        self.log_write("Unpinned")
+
+    def note_search(self, args):
+        pattern = search_pattern(" ".join(args))
+        vault = self.vault
 
-        except VaultError as e:
-            log.write(str(e))
+        hits = []
+        unreadable = []
+        for note_id, meta in vault.list_notes().items():
+            title = meta["title"]
+            if not pattern.search(title):
+                # one missing or corrupt note must not end the search
+                try:
+                    body = vault.read_note(note_id)
+                except VaultError:
+                    unreadable.append(escape_title(title))
+                    continue
+                if not pattern.search(body):
+                    continue
+            hits.append(escape_title(title))
+
+        lines = hits or ["No matches"]
+        if unreadable:
+            lines.append(f"[red]Unreadable:[/] {', '.join(unreadable)}")
+        self.log_write("\n".join(lines))
+
+    def note_pinned(self, args):
+        if self.pins:
+            self.log_write("\n".join(f"📌 {escape_title(p)}" for p in self.pins))
 
     # =====================================================
     # STATUS BAR UPDATE
     # =====================================================
 
     def update_status(self, text: str):
-        self.query_one("#statusbar", StatusBar).set(text)
+        self._status.set(text)
 
 
 # =====================================================
@@ -10,10 +10,11 @@ from __future__ import annotations
 
 import os
 import json
-import tempfile
 from pathlib import Path
 from typing import Dict, Optional
 
+from vault import atomic_write
+
 
 class StorageError(Exception):
     pass
@@ -45,16 +46,7 @@ class Storage:
         path = self._path(name)
 
         try:
-            with tempfile.NamedTemporaryFile(
-                dir=self.base_dir,
-                delete=False
-            ) as tmp:
-                tmp.write(data)
-                tmp.flush()
-                os.fsync(tmp.fileno())
-
-            os.replace(tmp.name, path)
-
+            atomic_write(path, data)
         except Exception as e:
             raise StorageError(f"Failed to write file: {e}")
 
@@ -65,11 +57,10 @@ class Storage:
     def read_bytes(self, name: str) -> bytes:
         path = self._path(name)
 
-        if not path.exists():
-            raise StorageError("File does not exist.")
-
         try:
             return path.read_bytes()
+        except FileNotFoundError:
+            raise StorageError("File does not exist.")
         except Exception as e:
             raise StorageError(f"Failed to read file: {e}")
 
@@ -80,8 +71,7 @@ class Storage:
     def delete(self, name: str):
         path = self._path(name)
         try:
-            if path.exists():
-                path.unlink()
+            path.unlink(missing_ok=True)
         except Exception as e:
             raise StorageError(f"Failed to delete file: {e}")
 
@@ -91,7 +81,10 @@ class Storage:
 
     def list(self) -> list[str]:
         try:
-            return [p.name for p in self.base_dir.iterdir() if p.is_file()]
+            # DirEntry.is_file() reuses the d_type from the directory
+            # read, so no per-entry stat() is issued.
+            with os.scandir(self.base_dir) as it:
+                return sorted(e.name for e in it if e.is_file())
         except Exception as e:
             raise StorageError(f"Failed to list files: {e}")
 
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# app/main.py and app/storage.py import vault.py as a top-level module
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
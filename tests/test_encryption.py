@@ -0,0 +1,105 @@
+import os
+import struct
+import tempfile
+import unittest
+
+from app.encryption import (
+    FILE_VERSION,
+    MAGIC,
+    NONCE_SIZE,
+    SALT_SIZE,
+    TAG_SIZE,
+    OsirisCrypto,
+    OsirisCryptoError,
+)
+
+PASSWORD = "Correct-Horse-9"
+FRAME = struct.pack(">?I", True, TAG_SIZE) + b"\0" * TAG_SIZE
+
+
+def header(version=FILE_VERSION, salt_len=SALT_SIZE, nonce_len=NONCE_SIZE):
+    u32 = struct.Struct(">I").pack
+    return (
+        MAGIC + u32(version)
+        + u32(salt_len) + b"s" * salt_len
+        + u32(nonce_len) + b"n" * nonce_len
+        + u32(0)
+    )
+
+
+class DecryptFileHeaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.crypto = OsirisCrypto()
+        self.dir = tempfile.TemporaryDirectory()
+        self.src = os.path.join(self.dir.name, "in.osiris")
+        self.dst = os.path.join(self.dir.name, "out.txt")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def decrypt(self, blob: bytes):
+        with open(self.src, "wb") as f:
+            f.write(blob)
+        self.crypto.decrypt_file(self.src, self.dst, PASSWORD)
+
+    def test_truncated_header(self):
+        with self.assertRaises(OsirisCryptoError):
+            self.decrypt(header()[:-6])
+        self.assertFalse(os.path.exists(self.dst))
+
+    def test_wrong_nonce_length(self):
+        for nonce_len in (NONCE_SIZE - 1, NONCE_SIZE + 1, 64):
+            with self.subTest(nonce_len=nonce_len):
+                with self.assertRaises(OsirisCryptoError):
+                    # a well-formed final frame, so a bad nonce would
+                    # reach the per-chunk nonce derivation
+                    self.decrypt(header(nonce_len=nonce_len) + FRAME)
+                self.assertFalse(os.path.exists(self.dst))
+
+    def test_wrong_salt_length(self):
+        # claims a 4 GiB salt; must be rejected before any read
+        blob = MAGIC + struct.pack(">II", FILE_VERSION, 0xFFFFFFFF)
+        with self.assertRaises(OsirisCryptoError):
+            self.decrypt(blob + b"\0" * 64)
+        self.assertFalse(os.path.exists(self.dst))
+
+    def test_tampered_chunk_removes_output(self):
+        with open(self.src + ".plain", "wb") as f:
+            f.write(os.urandom(1000))
+        self.crypto.encrypt_file(self.src + ".plain", self.src, PASSWORD)
+
+        with open(self.src, "r+b") as f:
+            f.seek(-1, os.SEEK_END)
+            last = f.read(1)
+            f.seek(-1, os.SEEK_END)
+            f.write(bytes([last[0] ^ 1]))
+
+        with self.assertRaises(OsirisCryptoError):
+            self.crypto.decrypt_file(self.src, self.dst, PASSWORD)
+        self.assertFalse(os.path.exists(self.dst))
+
+    def test_roundtrip(self):
+        data = os.urandom(3 * 64 * 1024 + 5)
+        with open(self.src + ".plain", "wb") as f:
+            f.write(data)
+        self.crypto.encrypt_file(self.src + ".plain", self.src, PASSWORD)
+        self.crypto.decrypt_file(self.src, self.dst, PASSWORD)
+        with open(self.dst, "rb") as f:
+            self.assertEqual(f.read(), data)
+
+
+class ParseHeaderTest(unittest.TestCase):
+
+    def test_wrong_nonce_length(self):
+        crypto = OsirisCrypto()
+        blob = crypto.encrypt(b"hi", PASSWORD)
+        bad = blob.replace(
+            struct.pack(">I", NONCE_SIZE), struct.pack(">I", NONCE_SIZE + 4), 1
+        )
+        with self.assertRaises(OsirisCryptoError):
+            crypto.decrypt(bad, PASSWORD)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,197 @@
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# app.main resolves ~/.osiris at import time; keep it out of the real home
+os.environ["HOME"] = tempfile.mkdtemp()
+
+from app import main  # noqa: E402
+from vault import Vault  # noqa: E402
+
+PASSWORD = "Correct-Horse-9"
+
+
+class AppTestCase(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        data = Path(tmp.name)
+        self.data_dir = data
+
+        for name, value in (
+            ("DATA_DIR", data),
+            ("HISTORY_FILE", data / "history.json"),
+            ("PIN_FILE", data / "pins.json"),
+        ):
+            patcher = mock.patch.object(main, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def log_lines(app) -> list[str]:
+        return [line.text.rstrip() for line in app._log.lines]
+
+    async def wait_for(self, pilot, predicate, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not predicate():
+            if time.monotonic() > deadline:
+                self.fail("timed out waiting for the app")
+            await pilot.pause(0.05)
+
+
+def slow_unlock(delay=0.3):
+    real_unlock = Vault.unlock
+
+    def unlock(vault, password):
+        time.sleep(delay)
+        real_unlock(vault, password)
+
+    return mock.patch.object(Vault, "unlock", unlock)
+
+
+class UnlockTest(AppTestCase):
+
+    async def test_second_unlock_refused_while_pending(self):
+        with slow_unlock():
+            app = main.OsirisCLI()
+            async with app.run_test() as pilot:
+                app.run_command_safe(f"unlock {PASSWORD}")
+                app.run_command_safe("unlock wrong-password")
+                await self.wait_for(pilot, lambda: not app._unlock_pending)
+
+                lines = self.log_lines(app)
+                self.assertTrue(app.osiris_mode)
+                self.assertIn("Unlock already in progress", lines)
+                self.assertNotIn("Unlock failed", lines)
+
+    async def test_lock_drops_pending_unlock(self):
+        with slow_unlock():
+            app = main.OsirisCLI()
+            async with app.run_test() as pilot:
+                app.run_command_safe(f"unlock {PASSWORD}")
+                app.run_command_safe("lock")
+                await pilot.pause(0.6)
+
+                self.assertFalse(app.osiris_mode)
+                self.assertIsNone(app.vault)
+                self.assertNotIn("Vault unlocked", self.log_lines(app))
+
+
+class HistoryCursorTest(AppTestCase):
+
+    async def submit(self, pilot, app, cmd):
+        app._input.value = cmd
+        await pilot.press("enter")
+
+    async def test_hotkey_command_resets_cursor(self):
+        app = main.OsirisCLI()
+        async with app.run_test() as pilot:
+            await self.submit(pilot, app, "help")
+            await self.submit(pilot, app, f"unlock {PASSWORD}")
+            await self.wait_for(pilot, lambda: app.osiris_mode)
+
+            # ctrl+n runs "note list" without going through the Input
+            await pilot.press("ctrl+n")
+            await pilot.press("up")
+            self.assertEqual(app._input.value, "note list")
+
+            await pilot.press("up")
+            self.assertEqual(app._input.value, f"unlock {PASSWORD}")
+
+    async def test_ctrl_p_leaves_cursor_alone(self):
+        app = main.OsirisCLI()
+        async with app.run_test() as pilot:
+            await self.submit(pilot, app, "help")
+            await self.submit(pilot, app, "status")
+
+            await pilot.press("ctrl+p")
+            await pilot.press("up")
+            self.assertEqual(app._input.value, "status")
+
+
+class NoteSearchTest(AppTestCase):
+
+    async def test_missing_note_file_is_skipped(self):
+        app = main.OsirisCLI()
+        async with app.run_test() as pilot:
+            app.run_command_safe(f"unlock {PASSWORD}")
+            await self.wait_for(pilot, lambda: app.osiris_mode)
+
+            for title in ("alpha", "broken", "gamma"):
+                app.run_command_safe(f"note create {title}")
+                app.run_command_safe(f"note append {title} needle {title}")
+
+            vault = app.vault
+            meta = vault.list_notes()[vault.find_note_id("broken")]
+            (self.data_dir / meta["file"]).unlink()
+
+            app.run_command_safe("note search needle")
+            await pilot.pause()
+
+            lines = self.log_lines(app)
+            prompt = f"{app.username}@{app.hostname} $ note search needle"
+            tail = lines[lines.index(prompt) + 1:]
+            self.assertEqual(tail[:3], ["alpha", "gamma", "Unreadable: broken"])
+
+
+class FailingSaveTest(AppTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.fail_writes = True
+        self.write_calls = 0
+        real_write = main.atomic_write
+
+        def atomic_write(path, data):
+            self.write_calls += 1
+            if self.fail_writes:
+                raise OSError(28, "No space left on device")
+            real_write(path, data)
+
+        patcher = mock.patch.object(main, "atomic_write", atomic_write)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def save_reports(self, app) -> list[str]:
+        return [
+            line for line in self.log_lines(app)
+            if line.startswith(("Save failed", "Saves resumed"))
+        ]
+
+    async def test_repeated_failures_reported_once(self):
+        app = main.OsirisCLI()
+        async with app.run_test() as pilot:
+            for i in range(6):
+                app.run_command_safe("status")
+                app.flush_pending(background=False)
+            await pilot.pause()
+
+            self.assertEqual(self.save_reports(app), [
+                "Save failed: [Errno 28] No space left on device",
+            ])
+
+            self.fail_writes = False
+            app.flush_pending(background=False)
+            await pilot.pause()
+            self.assertEqual(self.save_reports(app)[-1], "Saves resumed")
+            self.assertTrue(main.HISTORY_FILE.exists())
+
+    async def test_background_retries_back_off(self):
+        with mock.patch.object(main, "FLUSH_INTERVAL", 0.02):
+            app = main.OsirisCLI()
+            async with app.run_test() as pilot:
+                app.run_command_safe("status")
+                await pilot.pause(1.0)
+
+                # ~50 ticks ran; backoff leaves only a handful of attempts
+                self.assertLess(self.write_calls, 12)
+                self.assertEqual(len(self.save_reports(app)), 1)
+                self.fail_writes = False
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -19,6 +19,7 @@ import uuid
 import json
 import base64
 import hashlib
+import tempfile
 from typing import Dict, Optional
 from pathlib import Path
 
@@ -30,11 +31,59 @@ CRYPTO_AVAILABLE = True
 
 try:
     from Crypto.Cipher import AES
-    from Crypto.Protocol.KDF import PBKDF2
-    from Crypto.Random import get_random_bytes
 except Exception:
     CRYPTO_AVAILABLE = False
 
+# ---------------------------------------------------------
+# FALLBACK STREAM
+# ---------------------------------------------------------
+
+def _xor_stream(data: bytes, stream: bytes) -> bytes:
+    """
+    XOR data against a repeating keystream in one pass.
+
+    Both operands are widened to Python ints so the XOR runs
+    inside CPython's bignum code instead of per byte.
+    """
+
+    n = len(data)
+    if not n:
+        return b""
+
+    reps, rem = divmod(n, len(stream))
+    keystream = stream * reps + stream[:rem]
+
+    return (
+        int.from_bytes(data, "big") ^ int.from_bytes(keystream, "big")
+    ).to_bytes(n, "big")
+
+# ---------------------------------------------------------
+# ATOMIC WRITE
+# ---------------------------------------------------------
+
+def atomic_write(path: Path, data: bytes):
+    """
+    Write via a temp file + rename so a crash mid-write never
+    leaves a torn file behind. The temp file is removed if the
+    write, fsync or rename fails.
+    """
+
+    with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as tmp:
+        try:
+            tmp.write(data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        except BaseException:
+            tmp.close()
+            os.unlink(tmp.name)
+            raise
+
+    try:
+        os.replace(tmp.name, path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+
 # ---------------------------------------------------------
 # ERRORS
 # ---------------------------------------------------------
@@ -68,6 +117,8 @@ class Vault:
 
         self._password: Optional[str] = None
         self._index: Dict[str, Dict] = {}
+        # title -> note_id, first match in index order
+        self._titles: Dict[str, str] = {}
         self._key: Optional[bytes] = None
 
         self._salt_path = self.base_dir / self.SALT_FILE
@@ -80,24 +131,27 @@ class Vault:
         self._password = password
 
         # create salt if not exists
-        if not self._salt_path.exists():
-            self._salt_path.write_bytes(os.urandom(32))
-
-        salt = self._salt_path.read_bytes()
+        try:
+            salt = self._salt_path.read_bytes()
+        except FileNotFoundError:
+            salt = os.urandom(32)
+            self._salt_path.write_bytes(salt)
 
         self._key = self._derive_key(password, salt)
 
-        index_path = self.base_dir / self.INDEX_FILE
-        if index_path.exists():
+        try:
             self._index = self._load_index()
-        else:
+        except FileNotFoundError:
             self._index = {}
             self._save_index()
 
+        self._rebuild_titles()
+
     def lock(self):
         self._password = None
         self._key = None
         self._index.clear()
+        self._titles.clear()
 
     def is_unlocked(self) -> bool:
         return self._key is not None
@@ -115,8 +169,18 @@ class Vault:
         Strong password → key derivation.
         """
 
+        # Both branches run in OpenSSL via hashlib.
         if CRYPTO_AVAILABLE:
-            return PBKDF2(password, salt, dkLen=32, count=200000)
+            # Byte-identical to PyCryptodome's PBKDF2 defaults
+            # (HMAC-SHA1, password encoded as latin-1), so existing
+            # vaults still open.
+            return hashlib.pbkdf2_hmac(
+                "sha1",
+                password.encode("latin-1"),
+                salt,
+                200000,
+                dklen=32
+            )
 
         # fallback (secure)
         return hashlib.pbkdf2_hmac(
@@ -144,7 +208,7 @@ class Vault:
         nonce = os.urandom(16)
         stream = hashlib.sha256(self._key + nonce).digest()
 
-        encrypted = bytes(b ^ stream[i % len(stream)] for i, b in enumerate(plaintext))
+        encrypted = _xor_stream(plaintext, stream)
         mac = hashlib.sha256(self._key + encrypted).digest()
 
         return base64.b64encode(nonce + mac + encrypted)
@@ -172,7 +236,7 @@ class Vault:
             raise VaultIntegrityError("Invalid password or corrupted vault.")
 
         stream = hashlib.sha256(self._key + nonce).digest()
-        return bytes(b ^ stream[i % len(stream)] for i, b in enumerate(ciphertext))
+        return _xor_stream(ciphertext, stream)
 
     # -----------------------------------------------------
     # INDEX
@@ -181,7 +245,7 @@ class Vault:
     def _save_index(self):
         data = json.dumps(self._index, ensure_ascii=False).encode()
         enc = self._encrypt(data)
-        (self.base_dir / self.INDEX_FILE).write_bytes(enc)
+        atomic_write(self.base_dir / self.INDEX_FILE, enc)
 
     def _load_index(self) -> Dict:
         enc = (self.base_dir / self.INDEX_FILE).read_bytes()
@@ -202,7 +266,7 @@ class Vault:
         filename = f"{note_id}.note"
 
         enc = self._encrypt(content.encode())
-        (self.base_dir / filename).write_bytes(enc)
+        atomic_write(self.base_dir / filename, enc)
 
         self._index[note_id] = {
             "title": title,
@@ -210,6 +274,7 @@ class Vault:
             "created": time.time(),
             "updated": time.time(),
         }
+        self._titles.setdefault(title, note_id)
 
         self._save_index()
         return note_id
@@ -223,11 +288,11 @@ class Vault:
         if not meta:
             raise VaultError("Note not found.")
 
-        file_path = self.base_dir / meta["file"]
-        if not file_path.exists():
+        try:
+            enc = (self.base_dir / meta["file"]).read_bytes()
+        except FileNotFoundError:
             raise VaultError("Encrypted note file missing.")
 
-        enc = file_path.read_bytes()
         return self._decrypt(enc).decode()
 
     # -----------------------------------------------------
@@ -240,13 +305,33 @@ class Vault:
             raise VaultError("Note not found.")
 
         enc = self._encrypt(content.encode())
-        (self.base_dir / meta["file"]).write_bytes(enc)
+        atomic_write(self.base_dir / meta["file"], enc)
 
         meta["updated"] = time.time()
         self._save_index()
 
     # -----------------------------------------------------
 
+    def rename_note(self, note_id: str, title: str):
+        """
+        Titles live only in the index, so the note body is left as-is.
+        """
+        self._require_unlocked()
+
+        meta = self._index.get(note_id)
+        if not meta:
+            raise VaultError("Note not found.")
+
+        if meta["title"] == title:
+            return
+
+        meta["title"] = title
+        meta["updated"] = time.time()
+        self._rebuild_titles()
+        self._save_index()
+
+    # -----------------------------------------------------
+
     def delete_note(self, note_id: str):
         self._require_unlocked()
 
@@ -254,10 +339,9 @@ class Vault:
         if not meta:
             raise VaultError("Note not found.")
 
-        file_path = self.base_dir / meta["file"]
-        if file_path.exists():
-            file_path.unlink()
+        (self.base_dir / meta["file"]).unlink(missing_ok=True)
 
+        self._rebuild_titles()
         self._save_index()
 
     # -----------------------------------------------------
@@ -266,21 +350,34 @@ class Vault:
         self._require_unlocked()
         return dict(self._index)
 
+    def list_titles(self) -> list[str]:
+        """
+        Titles only — no copy of the per-note metadata.
+        """
+        self._require_unlocked()
+        return [meta["title"] for meta in self._index.values()]
+
     # -----------------------------------------------------
     # TITLE HELPERS
     # -----------------------------------------------------
 
-    def _find_id_by_title(self, title: str) -> str:
+    def _rebuild_titles(self):
+        titles: Dict[str, str] = {}
         for note_id, meta in self._index.items():
-            if meta["title"] == title:
-                return note_id
-        raise VaultError(f"Note '{title}' not found.")
+            titles.setdefault(meta["title"], note_id)
+        self._titles = titles
+
+    def find_note_id(self, title: str) -> str:
+        try:
+            return self._titles[title]
+        except KeyError:
+            raise VaultError(f"Note '{title}' not found.") from None
 
     def read_note_by_title(self, title: str) -> str:
-        return self.read_note(self._find_id_by_title(title))
+        return self.read_note(self.find_note_id(title))
 
     def update_note_by_title(self, title: str, content: str):
-        self.update_note(self._find_id_by_title(title), content)
+        self.update_note(self.find_note_id(title), content)
 
     def delete_note_by_title(self, title: str):
-        self.delete_note(self._find_id_by_title(title))
+        self.delete_note(self.find_note_id(title))